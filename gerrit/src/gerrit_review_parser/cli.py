@@ -1,9 +1,9 @@
 """CLI entry point for gerrit-review-parser."""
 
-import json
 import logging
 import sys
-from datetime import datetime
+import time
+from typing import BinaryIO
 
 import click
 
@@ -16,15 +16,15 @@ from .config import (
     load_gerrit_config,
     save_config,
 )
-from .display import display_review
 from .errors import fatal_exit
-from .gerrit import fetch_from_gerrit
-from .io import read_file, write_file
 from .models import Comment, GerritConfig, ReviewOutput
-from .parser import extract_comments, parse_json_content
 
 logger = logging.getLogger(__name__)
 
+_logging_configured = False
+
+_SAVE_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="gerrit-review-parser")
@@ -35,24 +35,51 @@ def cli():
 @cli.command()
 @click.option(
     "--file", "-f", "review_file",
-    type=click.Path(exists=True),
-    help="Path to Gerrit review JSON file",
+    type=click.File("rb"),
+    help="Path to Gerrit review JSON file ('-' for stdin)",
+)
+@click.option(
+    "--changeid", "-c", "changeids",
+    type=str,
+    multiple=True,
+    help="Gerrit change ID to fetch and parse (repeat to fetch several in parallel)",
 )
-@click.option("--changeid", "-c", type=str, help="Gerrit change ID to fetch and parse")
 @click.option("--query", "-q", type=str, help="Gerrit query string to fetch and parse")
 @click.option("--save", "-s", is_flag=True, help="Save fetched JSON to file")
 @click.option("--output", "-o", type=str, help="Custom output filename (use with --save)")
 @click.option("--debug", "debug_mode", is_flag=True, help="Enable debug output")
 @click.option("--unresolved-only", "-u", is_flag=True, help="Show only unresolved comments")
-@click.option("--json", "json_output", is_flag=True, help="Output as JSON for machine processing")
+@click.option(
+    "--json",
+    "json_output",
+    is_flag=True,
+    help="Output as JSON for machine processing (one document per line per change)",
+)
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent JSON output (use with --json; several changes become concatenated documents)",
+)
 @click.option("--dry-run", is_flag=True, help="Show SSH command without executing")
+@click.option("--full", is_flag=True, help="Also fetch per-patch-set file lists (larger response)")
 def parse(
-    review_file, changeid, query, save, output, debug_mode, unresolved_only, json_output, dry_run
+    review_file,
+    changeids,
+    query,
+    save,
+    output,
+    debug_mode,
+    unresolved_only,
+    json_output,
+    pretty,
+    dry_run,
+    full,
 ):
     """Parse Gerrit review JSON and display comments with file context.
 
     Examples:
         gerrit-review-parser parse --changeid 12345
+        gerrit-review-parser parse --changeid 12345 --changeid 12346 --save
         gerrit-review-parser parse --file review.json --unresolved-only
         gerrit-review-parser parse --query "status:open project:myproject" --save
         gerrit-review-parser parse --changeid 12345 --dry-run
@@ -62,18 +89,38 @@ def parse(
     if dry_run and review_file:
         logger.warning("--dry-run has no effect when reading from file")
 
-    if dry_run and (changeid or query):
-        _handle_dry_run(changeid, query, json_output)
+    if dry_run and (changeids or query):
+        for query_str in _query_strings(changeids, query):
+            _handle_dry_run(query_str, json_output, pretty, full)
         return
 
-    json_content = _load_json_content(review_file, changeid, query, save, output)
-
-    if not json_content:
-        fatal_exit("No input provided")
+    from .parser import extract_comments, iter_json_objects
 
-    data = parse_json_content(json_content)
-    comments = extract_comments(data, unresolved_only)
-    _output_result(data, comments, json_output, unresolved_only)
+    if len(changeids) > 1 and not review_file:
+        if output:
+            fatal_exit("--output cannot be used with multiple --changeid values")
+        json_contents = _fetch_many_and_save(changeids, save, full)
+    else:
+        changeid = changeids[0] if changeids else None
+        json_contents = [_load_json_content(review_file, changeid, query, save, output, full)]
+
+    for json_content in json_contents:
+        if not json_content:
+            fatal_exit("No input provided")
+
+        # A query can match several changes; Gerrit appends a stats record
+        parsed = rendered = 0
+        for data in iter_json_objects(json_content):
+            parsed += 1
+            if data.get("type") == "stats":
+                continue
+            comments = extract_comments(data, unresolved_only)
+            _output_result(data, comments, json_output, unresolved_only, pretty)
+            rendered += 1
+        if not parsed:
+            fatal_exit("Invalid JSON: no JSON object found")
+        if not rendered:
+            logger.warning("No changes found")
 
 
 @cli.command()
@@ -160,104 +207,186 @@ def config_show():
 
 
 def _setup_logging(debug: bool) -> None:
-    """Configure logging based on debug flag."""
+    """Configure logging based on debug flag (handlers are installed once)."""
+    global _logging_configured
     level = logging.DEBUG if debug else logging.INFO
+
+    if _logging_configured:
+        logging.getLogger().setLevel(level)
+        return
+
     logging.basicConfig(
         level=level,
         format="[%(levelname)s] %(message)s",
         stream=sys.stderr,
     )
+    _logging_configured = True
+
 
+def _normalize_changeid(changeid: str) -> tuple[str, str]:
+    """Return (query_str, bare_id) for a change ID given with or without 'change:'."""
+    bare_id = changeid.removeprefix("change:")
+    return f"change:{bare_id}", bare_id
 
-def _normalize_changeid(changeid: str) -> str:
-    """Ensure changeid has 'change:' prefix."""
-    if not changeid.startswith("change:"):
-        return f"change:{changeid}"
-    return changeid
 
+def _query_strings(changeids: tuple[str, ...], query: str | None) -> list[str]:
+    """Return the Gerrit query strings for the requested changes or query."""
+    if changeids:
+        return [_normalize_changeid(changeid)[0] for changeid in changeids]
+    return [query]
 
-def _handle_dry_run(changeid: str | None, query: str | None, json_output: bool) -> None:
+
+def _handle_dry_run(query_str: str, json_output: bool, pretty: bool, full: bool = False) -> None:
     """Handle dry-run mode: show command without executing."""
-    query_str = _normalize_changeid(changeid) if changeid else query
     config = load_gerrit_config()
-    cmd = build_query_command(config, query_str)
+    cmd = build_query_command(config, query_str, include_files=full)
     cmd_str = " ".join(cmd)
 
     if json_output:
-        click.echo(json.dumps({"dry_run": True, "command": cmd_str}, indent=2))
+        from .parser import dump_json
+
+        _write_stdout_bytes(dump_json({"dry_run": True, "command": cmd_str}, pretty))
     else:
         click.echo(f"[DRY-RUN] Would execute: {cmd_str}")
 
 
-def _load_from_file(filepath: str) -> str:
-    """Load JSON content from file."""
-    logger.debug(f"Loading review from file: {filepath}")
+def _load_from_file(review_file: BinaryIO) -> bytes:
+    """Load JSON content from an open binary file."""
+    name = getattr(review_file, "name", "-")
+    logger.debug("Loading review from file: %s", name)
     try:
-        return read_file(filepath)
+        return review_file.read()
     except Exception as e:
-        fatal_exit(f"Cannot read {filepath}: {e}")
+        fatal_exit(f"Cannot read {name}: {e}")
 
 
-def _fetch_and_save(query_str: str, save: bool, output: str | None, filename_prefix: str) -> str:
-    """Fetch from Gerrit and optionally save to file."""
-    json_content = fetch_from_gerrit(query_str)
+def _fetch_and_save(
+    query_str: str,
+    save: bool,
+    output: str | None,
+    change_number: str | None,
+    full: bool = False,
+) -> bytes:
+    """Fetch from Gerrit and optionally save to file.
 
+    When saving, ssh output is streamed straight to disk and read back once,
+    instead of being buffered in memory and then written out.
+    """
+    if not save:
+        from .gerrit import fetch_from_gerrit
+
+        return fetch_from_gerrit(query_str, include_files=full)
+
+    from .gerrit import fetch_to_file
+    from .io import read_bytes
+
+    filename = output or _default_save_name(change_number)
+    fetch_to_file(query_str, filename, include_files=full)
+    logger.info("Saved JSON to: %s", filename)
+
+    return read_bytes(filename)
+
+
+def _fetch_many_and_save(changeids: tuple[str, ...], save: bool, full: bool = False) -> list[bytes]:
+    """Fetch several changes from Gerrit concurrently and optionally save each."""
+    from .gerrit import fetch_many
+
+    logger.debug("Fetching change IDs: %s", ", ".join(changeids))
+    query_strs, change_numbers = zip(*map(_normalize_changeid, changeids))
+    json_contents = fetch_many(query_strs, include_files=full)
+
+    return [
+        _save_fetched(json_content, save, number)
+        for json_content, number in zip(json_contents, change_numbers)
+    ]
+
+
+def _save_fetched(json_content: bytes, save: bool, change_number: str | None) -> bytes:
+    """Optionally save fetched JSON to file, returning it unchanged.
+
+    The default filename is review-<change_number>.json, or a timestamped
+    query-*.json when the content came from a free-form query.
+    """
     if not save:
         return json_content
 
-    default_name = (
-        f"review-{filename_prefix.removeprefix('change:')}.json"
-        if filename_prefix.startswith("change:")
-        else f"query-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    )
+    from .io import write_file
 
-    filename = output or default_name
+    filename = _default_save_name(change_number)
     write_file(filename, json_content)
-    logger.info(f"Saved JSON to: {filename}")
+    logger.info("Saved JSON to: %s", filename)
 
     return json_content
 
 
+def _default_save_name(change_number: str | None) -> str:
+    """Return review-<change_number>.json, or a timestamped query-*.json."""
+    if change_number is not None:
+        return f"review-{change_number}.json"
+    return f"query-{time.strftime(_SAVE_TIMESTAMP_FORMAT, time.localtime())}.json"
+
+
 def _load_json_content(
-    review_file: str | None,
+    review_file: BinaryIO | None,
     changeid: str | None,
     query: str | None,
     save: bool,
     output: str | None,
-) -> str:
+    full: bool = False,
+) -> bytes:
     """Load JSON content from file, Gerrit, or stdin."""
     if review_file:
         return _load_from_file(review_file)
 
     if changeid:
-        logger.debug(f"Fetching change ID: {changeid}")
-        query_str = _normalize_changeid(changeid)
-        return _fetch_and_save(query_str, save, output, query_str)
+        logger.debug("Fetching change ID: %s", changeid)
+        query_str, change_number = _normalize_changeid(changeid)
+        return _fetch_and_save(query_str, save, output, change_number, full)
 
     if query:
-        logger.debug(f"Fetching query: {query}")
-        return _fetch_and_save(query, save, output, "query")
+        logger.debug("Fetching query: %s", query)
+        return _fetch_and_save(query, save, output, None, full)
 
     if sys.stdin.isatty():
-        return ""
+        return b""
     logger.debug("Reading from stdin")
-    return sys.stdin.read()
+    # Read raw bytes in one go; the parser decodes (or not) as it needs
+    return sys.stdin.buffer.read()
 
 
 def _output_result(
-    data: dict, comments: list[Comment], json_output: bool, unresolved_only: bool
+    data: dict,
+    comments: list[Comment],
+    json_output: bool,
+    unresolved_only: bool,
+    pretty: bool,
 ) -> None:
     """Output results as JSON or human-readable format."""
     if json_output:
-        result = ReviewOutput.from_gerrit_data(data, comments).to_dict()
-        click.echo(json.dumps(result, indent=2))
+        from .parser import dump_json
+
+        result = ReviewOutput.from_gerrit_data(data, comments)
+        _write_stdout_bytes(dump_json(result, pretty))
     else:
+        from .display import display_review
+
         display_review(data, comments, unresolved_only)
 
 
-def main():
-    """Entry point for the CLI."""
-    cli(prog_name="gerrit-review-parser")
+def _write_stdout_bytes(payload: bytes) -> None:
+    """Write an encoded payload and trailing newline to click's binary stdout."""
+    # click.echo() sends bytes to the underlying binary stream without decoding
+    click.echo(payload)
+
+
+def main(args: list[str] | None = None):
+    """Entry point for the CLI.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:]); lets
+            in-process callers reuse the already-built command tree
+    """
+    cli.main(args=args, prog_name="gerrit-review-parser")
 
 
 if __name__ == "__main__":
@@ -1,24 +1,47 @@
 """SSH command builders for Gerrit operations."""
 
+import functools
+
 from .models import GerritConfig
 
+# Opt-in (GERRIT_SSH_MULTIPLEX=1): multiplex queries over one authenticated
+# connection; the first ssh call becomes the master and later calls within
+# ControlPersist skip the handshake. These options override any Control*
+# settings from ssh_config. %C hashes the connection tuple, keeping the socket
+# path short enough for AF_UNIX. Older OpenSSH releases keep the backgrounded
+# master's stderr open, which can delay exit until ControlPersist expires.
+SSH_CONTROL_PATH = "~/.ssh/cm-%C"
+SSH_CONTROL_OPTIONS = [
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    f"ControlPath={SSH_CONTROL_PATH}",
+    "-o",
+    "ControlPersist=60s",
+]
+
 
-def build_ssh_base(config: GerritConfig) -> list[str]:
+@functools.lru_cache(maxsize=4)
+def build_ssh_base(config: GerritConfig) -> tuple[str, ...]:
     """Build base SSH command for Gerrit connection.
 
+    The result is cached per (frozen, hashable) config and shared between
+    calls, so it is returned as an immutable tuple.
+
     Args:
         config: GerritConfig with connection details
 
     Returns:
         Base SSH command arguments
     """
-    return [
+    return (
         "ssh",
+        *(SSH_CONTROL_OPTIONS if config.ssh_multiplex else ()),
         "-p",
         config.port,
         f"{config.user}@{config.host}",
         "gerrit",
-    ]
+    )
 
 
 def build_query_command(
@@ -27,7 +50,7 @@ def build_query_command(
     *,
     output_format: str = "JSON",
     include_patch_sets: bool = True,
-    include_files: bool = True,
+    include_files: bool = False,
     include_comments: bool = True,
 ) -> list[str]:
     """Build SSH command for Gerrit query.
@@ -37,13 +60,14 @@ def build_query_command(
         query_str: Gerrit query string
         output_format: Output format (JSON, TEXT)
         include_patch_sets: Include patch set information
-        include_files: Include file information
+        include_files: Include per-patch-set file lists (off by default;
+            comment extraction does not read them and they can be huge)
         include_comments: Include comment information
 
     Returns:
         List of command arguments
     """
-    cmd = build_ssh_base(config) + ["query", f"--format={output_format}"]
+    cmd = [*build_ssh_base(config), "query", f"--format={output_format}"]
 
     if include_patch_sets:
         cmd.append("--patch-sets")
@@ -1,17 +1,17 @@
 """Gerrit configuration loading and management."""
 
+import functools
 import os
-import tomllib
+from collections.abc import Mapping
 from pathlib import Path
 
-import tomli_w
-
 from .errors import fatal_exit
 from .models import GerritConfig
 
 DEFAULT_PORT = "29418"
-CONFIG_DIR = Path.home() / ".config" / "gerrit-review-parser"
-CONFIG_FILE = CONFIG_DIR / "config.toml"
+CONFIG_DIR_NAME = "gerrit-review-parser"
+CONFIG_FILE_NAME = "config.toml"
+SSH_MULTIPLEX_ENV = "GERRIT_SSH_MULTIPLEX"
 
 
 class ConfigError(Exception):
@@ -20,37 +20,45 @@ class ConfigError(Exception):
 
 def get_config_path() -> Path:
     """Get the path to the configuration file."""
-    return CONFIG_FILE
+    return _config_file()
+
+
+def clear_config_cache() -> None:
+    """Forget cached config file contents (e.g. after editing it in-process)."""
+    _parse_config_file.cache_clear()
 
 
 def load_gerrit_config(
-    env: dict[str, str] | None = None,
+    env: Mapping[str, str] | None = None,
 ) -> GerritConfig:
     """Load Gerrit configuration from environment, then TOML file fallback.
 
     Precedence: Environment variables > TOML config file
 
     Args:
-        env: Environment dict (defaults to os.environ copy)
+        env: Environment mapping (defaults to os.environ, read without
+            copying; it is never modified)
 
     Returns:
         GerritConfig with host, port, user
     """
-    env = dict(os.environ) if env is None else env
+    env = os.environ if env is None else env
 
     host = env.get("GERRIT_HOST")
     port = env.get("GERRIT_PORT")
     user = env.get("GERRIT_USER")
+    ssh_multiplex = env.get(SSH_MULTIPLEX_ENV, "").lower() in ("1", "true", "yes")
 
     if host and user:
-        return GerritConfig(host=host, port=port or DEFAULT_PORT, user=user)
+        return _build_config(host, port or DEFAULT_PORT, user, ssh_multiplex)
 
     file_config = _load_config_file()
     if file_config:
-        return GerritConfig(
-            host=host or file_config.host,
-            port=port or file_config.port,
-            user=user or file_config.user,
+        return _build_config(
+            host or file_config.host,
+            port or file_config.port,
+            user or file_config.user,
+            ssh_multiplex,
         )
 
     fatal_exit(
@@ -59,18 +67,52 @@ def load_gerrit_config(
     )
 
 
+@functools.lru_cache(maxsize=4)
+def _build_config(host: str, port: str, user: str, ssh_multiplex: bool = False) -> GerritConfig:
+    """Return a GerritConfig, reusing the instance for repeated identical settings."""
+    return GerritConfig(host=host, port=port, user=user, ssh_multiplex=ssh_multiplex)
+
+
+@functools.cache
+def _config_dir() -> Path:
+    """Return the config directory, resolving the home directory once."""
+    return Path.home() / ".config" / CONFIG_DIR_NAME
+
+
+@functools.cache
+def _config_file() -> Path:
+    """Return the config file path."""
+    return _config_dir() / CONFIG_FILE_NAME
+
+
 def _load_config_file() -> GerritConfig | None:
     """Load configuration from TOML file.
 
+    Parsed results are cached per (path, mtime, size), so repeated loads in
+    one process only stat the file unless it has changed.
+
     Returns:
         GerritConfig if file exists and is valid, None otherwise
     """
-    if not CONFIG_FILE.exists():
+    config_file = _config_file()
+    try:
+        st = config_file.stat()
+    except OSError:
         return None
 
+    return _parse_config_file(config_file, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_config_file(path: Path, mtime_ns: int, size: int) -> GerritConfig | None:
+    """Parse a TOML config file (cached; mtime_ns and size are part of the cache key).
+
+    Size catches rewrites that land within the filesystem's mtime granularity.
+    """
+    import tomllib
+
     try:
-        with open(CONFIG_FILE, "rb") as f:
-            data = tomllib.load(f)
+        data = tomllib.loads(path.read_bytes().decode("utf-8"))
 
         if not all(key in data for key in ["host", "port", "user"]):
             return None
@@ -80,7 +122,7 @@ def _load_config_file() -> GerritConfig | None:
             port=str(data["port"]),
             user=data["user"],
         )
-    except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError):
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError, KeyError, TypeError):
         return None
 
 
@@ -90,7 +132,10 @@ def save_config(config: GerritConfig) -> None:
     Args:
         config: GerritConfig to save
     """
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    import tomli_w
+
+    config_file = _config_file()
+    config_file.parent.mkdir(parents=True, exist_ok=True)
 
     data = {
         "host": config.host,
@@ -98,8 +143,9 @@ def save_config(config: GerritConfig) -> None:
         "user": config.user,
     }
 
-    with open(CONFIG_FILE, "wb") as f:
-        tomli_w.dump(data, f)
+    config_file.write_bytes(tomli_w.dumps(data).encode("utf-8"))
+
+    clear_config_cache()
 
 
 def get_config_with_sources() -> tuple[GerritConfig, dict[str, str]]:
@@ -112,12 +158,11 @@ def get_config_with_sources() -> tuple[GerritConfig, dict[str, str]]:
     Raises:
         ConfigError: If no configuration is found
     """
-    env = dict(os.environ)
     file_config = _load_config_file()
 
-    host = env.get("GERRIT_HOST")
-    port = env.get("GERRIT_PORT")
-    user = env.get("GERRIT_USER")
+    host = os.environ.get("GERRIT_HOST")
+    port = os.environ.get("GERRIT_PORT")
+    user = os.environ.get("GERRIT_USER")
 
     sources: dict[str, str] = {}
 
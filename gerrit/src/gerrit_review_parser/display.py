@@ -1,55 +1,75 @@
 """Display formatting for review output."""
 
 import logging
-import os
 from itertools import groupby
+from operator import attrgetter
 
 import click
 
-from .io import read_lines
+from .io import read_line_range
 from .models import Comment
 
 logger = logging.getLogger(__name__)
 
+_HEADER_RULE = "=" * 70
+_FILE_RULE = "-" * 40
+_CONTEXT_LINE_FORMAT = "     %4d %s %s"
+_CONTEXT_MARKERS = ("   ", ">>>")
+_STATUS_SUFFIXES = ("", " [UNRESOLVED]")
+
 
 def display_review(
     data: dict,
     comments: list[Comment],
     unresolved_only: bool = False,
 ) -> None:
-    """Display formatted review output."""
+    """Display formatted review output.
+
+    Comments must already be sorted by file and line, as returned by
+    extract_comments(); they are grouped by file without re-sorting.
+    """
     project = data.get("project", "Unknown")
     change_number = data.get("number", "Unknown")
     subject = data.get("subject", "No subject")
 
-    logger.debug(f"Project: {project}, Change: {change_number}")
+    logger.debug("Project: %s, Change: %s", project, change_number)
 
     if not comments:
         click.echo("No file comments found in review")
         return
 
-    click.echo(f"\n{'='*70}")
-    click.echo(f"Review #{change_number}")
-    click.echo(f"{subject}")
-    click.echo(f"Project: {project}")
+    lines = [
+        f"\n{_HEADER_RULE}",
+        f"Review #{change_number}",
+        f"{subject}",
+        f"Project: {project}",
+    ]
     if unresolved_only:
-        click.echo(f"Unresolved Comments: {len(comments)}")
+        lines.append(f"Unresolved Comments: {len(comments)}")
     else:
-        click.echo(f"Comments: {len(comments)}")
-    click.echo(f"{'='*70}")
+        lines.append(f"Comments: {len(comments)}")
+    lines.append(_HEADER_RULE)
+
+    for file_path, group in groupby(comments, key=attrgetter("file")):
+        file_comments = list(group)
+        lines.append(f"\n{file_path}")
+        lines.append(_FILE_RULE)
 
-    sorted_comments = sorted(comments, key=lambda c: (c.file, c.line))
-    for file_path, file_comments in groupby(sorted_comments, key=lambda c: c.file):
-        click.echo(f"\n{file_path}")
-        click.echo("-" * 40)
+        # One read per file covers the context of all its (line-sorted) comments
+        window = None
+        if _is_safe_path(file_path):
+            window = _read_source_window(file_path, file_comments[0].line, file_comments[-1].line)
 
         for comment in file_comments:
-            status = " [UNRESOLVED]" if comment.unresolved else ""
-            click.echo(f"\nL{comment.line:4d} | {comment.reviewer}{status}")
-            click.echo(f"     | {comment.message}")
+            status = _STATUS_SUFFIXES[bool(comment.unresolved)]
+            lines.append(f"\nL{comment.line:4d} | {comment.reviewer}{status}")
+            lines.append(f"     | {comment.message}")
 
-            if _is_safe_path(comment.file):
-                show_code_context(comment.file, comment.line)
+            if window is not None:
+                lines.extend(_format_context(window, comment.line))
+
+    # Emit the whole review in one write instead of one per line
+    click.echo("\n".join(lines))
 
 
 def _is_safe_path(filepath: str) -> bool:
@@ -63,21 +83,50 @@ def _is_safe_path(filepath: str) -> bool:
 
 def show_code_context(filepath: str, line_num: int, context: int = 2) -> None:
     """Display code context around a comment."""
-    logger.debug(f"Reading file: {filepath}")
+    lines = _code_context_lines(filepath, line_num, context)
+    if lines:
+        click.echo("\n".join(lines))
 
-    if not os.path.exists(filepath):
-        logger.debug(f"File not found: {filepath}")
-        return
 
-    try:
-        lines = read_lines(filepath)
-        start = max(0, line_num - context - 1)
-        end = min(len(lines), line_num + context)
+def _code_context_lines(filepath: str, line_num: int, context: int = 2) -> list[str]:
+    """Format code context around a comment as output lines."""
+    window = _read_source_window(filepath, line_num, line_num, context)
+    if window is None:
+        return []
+    return _format_context(window, line_num, context)
+
 
-        click.echo("")
-        for i in range(start, end):
-            marker = ">>>" if i == line_num - 1 else "   "
-            click.echo(f"     {i+1:4d} {marker} {lines[i].rstrip()}")
+def _read_source_window(
+    filepath: str, first_line: int, last_line: int, context: int = 2
+) -> tuple[int, list[str]] | None:
+    """Read the lines needed to show context for comments on first_line..last_line.
 
+    Returns:
+        (offset, lines) where offset is the zero-based index of lines[0],
+        or None if the file cannot be read
+    """
+    logger.debug("Reading file: %s", filepath)
+
+    start = max(0, first_line - context - 1)
+    try:
+        return start, read_line_range(filepath, start, last_line + context)
+    except (FileNotFoundError, IsADirectoryError):
+        logger.debug("File not found: %s", filepath)
+        return None
     except Exception as e:
-        logger.error(f"Cannot read {filepath}: {e}")
+        logger.error("Cannot read %s: %s", filepath, e)
+        return None
+
+
+def _format_context(window: tuple[int, list[str]], line_num: int, context: int = 2) -> list[str]:
+    """Format the context around line_num from a window read by _read_source_window."""
+    offset, source = window
+    start = max(offset, line_num - context - 1)
+    end = min(line_num + context, offset + len(source))
+
+    output = [""]
+    target = line_num - 1
+    for i in range(start, end):
+        marker = _CONTEXT_MARKERS[i == target]
+        output.append(_CONTEXT_LINE_FORMAT % (i + 1, marker, source[i - offset].rstrip()))
+    return output
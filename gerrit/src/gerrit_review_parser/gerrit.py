@@ -1,7 +1,14 @@
 """Gerrit SSH/API layer for fetching review data."""
 
+import functools
 import logging
+import os
+import stat
 import subprocess
+import tempfile
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from .commands import build_query_command
 from .config import load_gerrit_config
@@ -10,30 +17,145 @@ from .models import GerritConfig
 
 logger = logging.getLogger(__name__)
 
+MAX_PARALLEL_FETCHES = 8
+
 
 def fetch_from_gerrit(
-    query_str: str, config: GerritConfig | None = None
-) -> str:
+    query_str: str, config: GerritConfig | None = None, *, include_files: bool = False
+) -> bytes:
     """Fetch review data from Gerrit using SSH command.
 
     Args:
         query_str: Gerrit query string (e.g., "change:12345")
         config: Optional GerritConfig (loads from env if not provided)
+        include_files: Also request per-patch-set file lists (--files)
 
     Returns:
-        Raw JSON response from Gerrit
+        Raw JSON response from Gerrit (undecoded bytes)
     """
     if config is None:
         config = load_gerrit_config()
 
-    cmd = build_query_command(config, query_str)
+    cmd = build_query_command(config, query_str, include_files=include_files)
+    if config.ssh_multiplex:
+        _ensure_ssh_dir()
 
-    logger.debug(f"Running: {' '.join(cmd)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running: %s", " ".join(cmd))
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, check=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
-        fatal_exit(f"Gerrit query failed: {e.stderr}")
+        fatal_exit(f"Gerrit query failed: {e.stderr.decode(errors='replace')}")
     except Exception as e:
         fatal_exit(f"Failed to run Gerrit query: {e}")
+
+
+def fetch_to_file(
+    query_str: str,
+    out_path: str | Path,
+    config: GerritConfig | None = None,
+    *,
+    include_files: bool = False,
+) -> None:
+    """Fetch review data from Gerrit straight into a file.
+
+    The ssh process writes to the file descriptor directly, so the response
+    never has to be buffered in Python memory on its way to disk.
+
+    Args:
+        query_str: Gerrit query string (e.g., "change:12345")
+        out_path: File to write the raw JSON response to
+        config: Optional GerritConfig (loads from env if not provided)
+        include_files: Also request per-patch-set file lists (--files)
+    """
+    if config is None:
+        config = load_gerrit_config()
+
+    cmd = build_query_command(config, query_str, include_files=include_files)
+    if config.ssh_multiplex:
+        _ensure_ssh_dir()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running: %s > %s", " ".join(cmd), out_path)
+
+    # Stream into a sibling temp file so a failed query never clobbers an
+    # existing out_path; os.replace() swaps it in atomically on success.
+    out_path = Path(out_path)
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=out_path.parent, prefix=f".{out_path.name}.", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+            # The temp file is created 0600; give it the mode open() would have
+            os.fchmod(f.fileno(), _output_mode(out_path))
+            subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, check=True)
+        os.replace(tmp_path, out_path)
+        tmp_path = None
+    except subprocess.CalledProcessError as e:
+        fatal_exit(f"Gerrit query failed: {e.stderr.decode(errors='replace')}")
+    except OSError as e:
+        fatal_exit(f"Failed to run Gerrit query: {e}")
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def fetch_many(
+    query_strs: Sequence[str],
+    config: GerritConfig | None = None,
+    *,
+    include_files: bool = False,
+) -> list[bytes]:
+    """Fetch several queries from Gerrit concurrently.
+
+    Each query runs in its own ssh process; threads just wait on them, so
+    total time is bounded by the slowest query rather than the sum.
+
+    Args:
+        query_strs: Gerrit query strings
+        config: Optional GerritConfig (loads from env if not provided)
+        include_files: Also request per-patch-set file lists (--files)
+
+    Returns:
+        Raw JSON responses, in the same order as query_strs
+    """
+    if config is None:
+        config = load_gerrit_config()
+
+    workers = max(1, min(MAX_PARALLEL_FETCHES, len(query_strs)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda query_str: fetch_from_gerrit(query_str, config, include_files=include_files),
+                query_strs,
+            )
+        )
+
+
+def _output_mode(path: Path) -> int:
+    """Return the permission bits for writing path: kept if it exists, else 0666 & ~umask."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_umask()
+
+
+@functools.cache
+def _umask() -> int:
+    """Return the process umask (read once; os.umask() can only read it by setting it)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+@functools.cache
+def _ensure_ssh_dir() -> None:
+    """Create ~/.ssh so ssh can place its ControlMaster socket there."""
+    try:
+        (Path.home() / ".ssh").mkdir(mode=0o700, exist_ok=True)
+    except OSError as e:
+        # ssh still works without multiplexing; it just warns and carries on
+        logger.debug("Cannot create ~/.ssh: %s", e)
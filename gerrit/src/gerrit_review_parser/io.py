@@ -1,52 +1,56 @@
 """File I/O utilities."""
 
 import logging
+from itertools import islice
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
-def read_file(filepath: str | Path) -> str:
-    """Read entire file content.
+def read_bytes(filepath: str | Path) -> bytes:
+    """Read entire file content as raw bytes.
 
     Args:
         filepath: Path to file
 
     Returns:
-        File content as string
+        File content, undecoded
 
     Raises:
         FileNotFoundError: If file doesn't exist
         IOError: If file cannot be read
     """
-    with open(filepath, encoding="utf-8") as f:
+    with open(filepath, "rb") as f:
         return f.read()
 
 
-def read_lines(filepath: str | Path) -> list[str]:
-    """Read file as list of lines.
+def read_line_range(filepath: str | Path, start: int, end: int) -> list[str]:
+    """Read lines [start, end) of a file, stopping once end is reached.
 
     Args:
         filepath: Path to file
+        start: Zero-based index of the first line to return
+        end: Zero-based index one past the last line to return
 
     Returns:
-        List of lines (with newlines intact)
+        List of lines (with newlines intact); shorter if the file ends early
 
     Raises:
         FileNotFoundError: If file doesn't exist
         IOError: If file cannot be read
     """
     with open(filepath, encoding="utf-8") as f:
-        return f.readlines()
+        return list(islice(f, start, end))
 
 
-def write_file(filepath: str | Path, content: str) -> None:
-    """Write content to file.
+def write_file(filepath: str | Path, content: str | bytes) -> None:
+    """Write content to file in a single binary write.
 
     Args:
         filepath: Path to file
-        content: Content to write
+        content: Content to write (str is encoded as UTF-8)
     """
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
-    logger.debug(f"Wrote {len(content)} characters to {filepath}")
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    with open(filepath, "wb") as f:
+        f.write(data)
+    logger.debug("Wrote %d bytes to %s", len(data), filepath)
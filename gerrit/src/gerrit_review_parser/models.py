@@ -1,18 +1,19 @@
 """Data models for gerrit-review-parser."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GerritConfig:
     """Immutable configuration for Gerrit SSH connection."""
 
     host: str
     port: str
     user: str
+    ssh_multiplex: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment:
     """A single review comment (immutable)."""
 
@@ -22,8 +23,18 @@ class Comment:
     message: str
     unresolved: bool
 
+    def to_dict(self) -> dict:
+        """Return the comment as a plain JSON-serializable dict."""
+        return {
+            "file": self.file,
+            "line": self.line,
+            "reviewer": self.reviewer,
+            "message": self.message,
+            "unresolved": self.unresolved,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewOutput:
     """Output structure for JSON serialization."""
 
@@ -42,6 +53,10 @@ class ReviewOutput:
         )
 
     def to_dict(self) -> dict:
-        result = asdict(self)
-        result["comments"] = list(result["comments"])
-        return result
+        # Built directly: asdict() recurses and deep-copies every field
+        return {
+            "project": self.project,
+            "change_number": self.change_number,
+            "subject": self.subject,
+            "comments": [comment.to_dict() for comment in self.comments],
+        }
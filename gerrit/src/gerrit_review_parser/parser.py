@@ -2,78 +2,176 @@
 
 import json
 import logging
+import re
+import sys
+from collections.abc import Iterator
+from operator import attrgetter
 
 from .errors import fatal_exit
-from .models import Comment
+from .models import Comment, ReviewOutput
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (``pip install .[fast]``)
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_COMMENT_SORT_KEY = attrgetter("file", "line")
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+
 
-def parse_json_content(json_content: str) -> dict:
+def parse_json_content(json_content: str | bytes) -> dict:
     """Parse JSON content, handling Gerrit's multi-object format.
 
-    Gerrit sometimes appends stats as a second JSON object.
-    Uses raw_decode() to extract just the first complete JSON object.
+    Returns the first object yielded by iter_json_objects(); anything after
+    it is never parsed.
 
     Args:
-        json_content: Raw JSON string from Gerrit
+        json_content: Raw JSON from Gerrit, as text or UTF-8 bytes
 
     Returns:
         Parsed JSON dictionary
     """
-    try:
-        return json.JSONDecoder().raw_decode(json_content)[0]
-    except json.JSONDecodeError as e:
-        fatal_exit(f"Invalid JSON: {e}")
+    for obj in iter_json_objects(json_content):
+        return obj
+    fatal_exit("Invalid JSON: no JSON object found")
 
 
-def extract_comments(data: dict, unresolved_only: bool = False) -> list[Comment]:
-    """Extract file comments from parsed Gerrit data.
+def iter_json_objects(json_content: str | bytes) -> Iterator[dict]:
+    """Yield every top-level JSON object in Gerrit's concatenated output.
 
-    Pure function using comprehensions and sorted() instead of mutable patterns.
+    Gerrit's query output is line-delimited: one object per matching change,
+    followed by a stats object. With orjson available, lines are parsed one
+    at a time; at the first line that is not a complete object (e.g. a
+    pretty-printed file) the rest is tried as one document, then decoded
+    incrementally with raw_decode(). Objects are produced lazily, so callers
+    that stop early never parse the remainder. Unparseable data after at
+    least one object is logged and ignored; with no object at all it is fatal.
 
     Args:
-        data: Parsed Gerrit JSON
-        unresolved_only: Filter to only unresolved comments
+        json_content: Raw JSON from Gerrit, as text or UTF-8 bytes
+
+    Yields:
+        Parsed JSON objects in document order
+    """
+    pos = 0
+    yielded = False
+    if orjson is not None:
+        newline = b"\n" if isinstance(json_content, bytes) else "\n"
+        view = memoryview(json_content) if isinstance(json_content, bytes) else json_content
+        while pos < len(json_content):
+            end = json_content.find(newline, pos)
+            if end == -1:
+                end = len(json_content)
+            try:
+                obj = orjson.loads(view[pos:end])
+            except orjson.JSONDecodeError:
+                break  # blank or partial line; handled below
+            yield obj
+            yielded = True
+            pos = end + 1
+        else:
+            return
+        try:
+            obj = orjson.loads(view[pos:])
+        except orjson.JSONDecodeError:
+            pass  # trailing object after a multi-line document, or invalid input
+        else:
+            yield obj
+            return
+
+    try:
+        if isinstance(json_content, bytes):
+            json_content = json_content[pos:].decode("utf-8")
+            pos = 0
+    except UnicodeDecodeError as e:
+        fatal_exit(f"Invalid UTF-8 in JSON input: {e}")
+
+    pos = _WHITESPACE.match(json_content, pos).end()
+    while pos < len(json_content):
+        try:
+            obj, pos = _DECODER.raw_decode(json_content, pos)
+        except json.JSONDecodeError as e:
+            if yielded:
+                logger.warning("Ignoring trailing data after JSON input: %s", e)
+                return
+            fatal_exit(f"Invalid JSON: {e}")
+        yield obj
+        yielded = True
+        pos = _WHITESPACE.match(json_content, pos).end()
+
+
+def dump_json(data: dict | ReviewOutput, pretty: bool = False) -> bytes:
+    """Serialize data as JSON.
+
+    orjson serializes a ReviewOutput (and its Comment dataclasses) natively,
+    so no intermediate dicts are built; the stdlib path converts it first.
+
+    Args:
+        data: JSON-serializable dictionary or ReviewOutput
+        pretty: Indent with two spaces instead of emitting compact JSON
 
     Returns:
-        List of Comment objects sorted by file and line
+        UTF-8 encoded JSON document
     """
-    raw_comments = [
-        comment
-        for patch_set in data.get("patchSets", [])
-        for comment in patch_set.get("comments", [])
-    ]
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if isinstance(data, ReviewOutput):
+        data = data.to_dict()
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-    comments = [c for c in (_extract_comment(r) for r in raw_comments) if c is not None]
 
-    if unresolved_only:
-        comments = [c for c in comments if c.unresolved]
+def iter_comments(data: dict, unresolved_only: bool = False) -> Iterator[Comment]:
+    """Yield file comments from parsed Gerrit data in document order.
 
-    logger.debug(f"Found {len(comments)} file comments")
+    Comments are produced lazily, so no intermediate lists are built.
 
-    return sorted(comments, key=lambda x: (x.file, x.line))
+    Args:
+        data: Parsed Gerrit JSON
+        unresolved_only: Filter to only unresolved comments
 
+    Yields:
+        Comment objects for valid comments
+    """
+    for patch_set in data.get("patchSets", ()):
+        for raw_comment in patch_set.get("comments", ()):
+            unresolved = raw_comment.get("unresolved", True)
+            # Check the flag on the raw dict so resolved comments are never built
+            if unresolved_only and not unresolved:
+                continue
+            # Built inline rather than via a helper: this runs once per comment.
+            # File paths and reviewer names repeat across comments, so intern them.
+            try:
+                comment = Comment(
+                    file=sys.intern(raw_comment["file"]),
+                    line=raw_comment["line"],
+                    reviewer=sys.intern(raw_comment["reviewer"]["name"]),
+                    message=raw_comment["message"],
+                    unresolved=unresolved,
+                )
+            except (KeyError, TypeError):
+                continue  # missing required fields
+            yield comment
 
-# --- Private helpers ---
 
+def extract_comments(data: dict, unresolved_only: bool = False) -> list[Comment]:
+    """Extract file comments from parsed Gerrit data.
 
-def _extract_comment(comment_data: dict) -> Comment | None:
-    """Extract a Comment from raw comment data.
+    Pure function: sorts the comments yielded by iter_comments().
 
     Args:
-        comment_data: Raw comment dict from Gerrit JSON
+        data: Parsed Gerrit JSON
+        unresolved_only: Filter to only unresolved comments
 
     Returns:
-        Comment if valid, None if missing required fields
+        List of Comment objects sorted by file and line
     """
-    try:
-        return Comment(
-            file=comment_data["file"],
-            line=comment_data["line"],
-            reviewer=comment_data["reviewer"]["name"],
-            message=comment_data["message"],
-            unresolved=comment_data.get("unresolved", True),
-        )
-    except (KeyError, TypeError):
-        return None
+    comments = sorted(iter_comments(data, unresolved_only), key=_COMMENT_SORT_KEY)
+
+    logger.debug("Found %d file comments", len(comments))
+
+    return comments
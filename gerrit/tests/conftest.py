@@ -1,8 +1,6 @@
 """Pytest configuration and fixtures for gerrit-review-parser tests."""
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
@@ -14,7 +12,7 @@ def cli_runner():
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_gerrit_json():
     """Return sample Gerrit JSON response for testing."""
     return """{
@@ -57,25 +55,31 @@ def sample_gerrit_json():
 }"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_parsed_data(sample_gerrit_json):
-    """Return parsed sample data."""
+    """Return parsed sample data (shared across tests; do not mutate)."""
     return json.loads(sample_gerrit_json)
 
 
-@pytest.fixture
-def sample_json_file(sample_gerrit_json):
-    """Create temp file with sample JSON, clean up after test."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write(sample_gerrit_json)
-        temp_path = Path(f.name)
-    yield temp_path
-    temp_path.unlink()
+@pytest.fixture(scope="session")
+def sample_comments(sample_parsed_data):
+    """Return comments extracted from the sample data (as an immutable tuple)."""
+    from gerrit_review_parser.parser import extract_comments
 
+    return tuple(extract_comments(sample_parsed_data))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def sample_json_file(sample_gerrit_json, tmp_path_factory):
+    """Create one temp file with sample JSON for the whole session."""
+    temp_path = tmp_path_factory.mktemp("data") / "sample.json"
+    temp_path.write_text(sample_gerrit_json, encoding="utf-8")
+    return temp_path
+
+
+@pytest.fixture(scope="session")
 def gerrit_env():
-    """Return test Gerrit environment variables."""
+    """Return test Gerrit environment variables (shared; do not mutate)."""
     return {
         "GERRIT_HOST": "gerrit.example.com",
         "GERRIT_USER": "testuser",
@@ -83,7 +87,7 @@ def gerrit_env():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gerrit_config():
     """Return test GerritConfig."""
     from gerrit_review_parser.models import GerritConfig
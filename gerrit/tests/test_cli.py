@@ -2,7 +2,9 @@
 
 import json
 
-from gerrit_review_parser.cli import cli
+import pytest
+
+from gerrit_review_parser.cli import cli, main
 
 
 def test_version_flag(cli_runner):
@@ -84,6 +86,19 @@ def test_dry_run_with_query(cli_runner, gerrit_env):
     assert "status:open" in result.output
 
 
+def test_dry_run_full_requests_files(cli_runner, gerrit_env):
+    """Test that --files is only part of the query when --full is given."""
+    result = cli_runner.invoke(cli, ["parse", "--changeid", "12345", "--dry-run"], env=gerrit_env)
+    assert result.exit_code == 0
+    assert "--files" not in result.output
+
+    result = cli_runner.invoke(
+        cli, ["parse", "--changeid", "12345", "--dry-run", "--full"], env=gerrit_env
+    )
+    assert result.exit_code == 0
+    assert "--files" in result.output
+
+
 def test_dry_run_with_json(cli_runner, gerrit_env):
     """Test that --dry-run combined with --json outputs JSON format."""
     result = cli_runner.invoke(
@@ -112,3 +127,215 @@ def test_config_show_help(cli_runner):
     result = cli_runner.invoke(cli, ["config", "show", "--help"])
     assert result.exit_code == 0
     assert "Display current configuration" in result.output
+
+
+def test_parse_from_stdin(cli_runner, sample_gerrit_json):
+    """Test that review JSON piped on stdin is parsed."""
+    result = cli_runner.invoke(cli, ["parse", "--json"], input=sample_gerrit_json)
+    assert result.exit_code == 0
+
+    parsed = json.loads(result.output)
+    assert parsed["change_number"] == 12345
+    assert len(parsed["comments"]) == 3
+
+
+def test_query_renders_every_change(cli_runner, monkeypatch):
+    """Test that every change matched by --query is rendered, skipping the stats record."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    def fake_fetch(query_str, **kwargs):
+        return b'{"number": 1}\n{"number": 2}\n{"type": "stats", "rowCount": 2}\n'
+
+    monkeypatch.setattr(gerrit_module, "fetch_from_gerrit", fake_fetch)
+
+    result = cli_runner.invoke(cli, ["parse", "--query", "status:open", "--json"])
+    assert result.exit_code == 0
+    numbers = [json.loads(line)["change_number"] for line in result.output.splitlines()]
+    assert numbers == [1, 2]
+
+
+def test_save_writes_fetched_json(cli_runner, monkeypatch, tmp_path, sample_gerrit_json):
+    """Test that --save writes the fetched JSON verbatim to --output."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    def fake_fetch_to_file(query_str, out_path, **kwargs):
+        with open(out_path, "wb") as f:
+            f.write(sample_gerrit_json.encode())
+
+    monkeypatch.setattr(gerrit_module, "fetch_to_file", fake_fetch_to_file)
+
+    out_file = tmp_path / "saved.json"
+    result = cli_runner.invoke(
+        cli, ["parse", "--changeid", "12345", "--save", "--output", str(out_file), "--json"]
+    )
+    assert result.exit_code == 0
+    assert out_file.read_text(encoding="utf-8") == sample_gerrit_json
+
+
+def test_save_default_filename(cli_runner, monkeypatch, tmp_path, sample_gerrit_json):
+    """Test that --save names the file after the bare change number."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    def fake_fetch_to_file(query_str, out_path, **kwargs):
+        with open(out_path, "wb") as f:
+            f.write(sample_gerrit_json.encode())
+
+    monkeypatch.setattr(gerrit_module, "fetch_to_file", fake_fetch_to_file)
+    monkeypatch.chdir(tmp_path)
+
+    result = cli_runner.invoke(cli, ["parse", "--changeid", "change:12345", "--save", "--json"])
+    assert result.exit_code == 0
+    assert (tmp_path / "review-12345.json").exists()
+
+
+def test_dry_run_multiple_changeids(cli_runner, gerrit_env):
+    """Test that --dry-run shows one command per --changeid."""
+    result = cli_runner.invoke(
+        cli,
+        ["parse", "-c", "12345", "-c", "12346", "--dry-run"],
+        env=gerrit_env,
+    )
+    assert result.exit_code == 0
+    assert result.output.count("[DRY-RUN]") == 2
+    assert "change:12345" in result.output
+    assert "change:12346" in result.output
+
+
+def test_multiple_changeids_fetched_together(cli_runner, monkeypatch, sample_gerrit_json):
+    """Test that several --changeid values are fetched in one batch and all rendered."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    batches = []
+
+    def fake_fetch_many(query_strs, **kwargs):
+        batches.append(list(query_strs))
+        return [sample_gerrit_json.encode()] * len(query_strs)
+
+    monkeypatch.setattr(gerrit_module, "fetch_many", fake_fetch_many)
+
+    result = cli_runner.invoke(cli, ["parse", "-c", "1", "-c", "2"])
+    assert result.exit_code == 0
+    assert batches == [["change:1", "change:2"]]
+    assert result.output.count("Review #12345") == 2
+
+
+def test_multiple_changeids_reject_output(cli_runner):
+    """Test that --output is rejected when several changes would be saved."""
+    result = cli_runner.invoke(cli, ["parse", "-c", "1", "-c", "2", "--save", "-o", "x.json"])
+    assert result.exit_code == 1
+
+
+def test_json_output_compact_by_default(cli_runner, sample_json_file):
+    """Test that --json emits a single compact line unless --pretty is given."""
+    compact = cli_runner.invoke(cli, ["parse", "--file", str(sample_json_file), "--json"])
+    pretty = cli_runner.invoke(
+        cli, ["parse", "--file", str(sample_json_file), "--json", "--pretty"]
+    )
+
+    assert compact.output.count("\n") == 1
+    assert pretty.output.count("\n") > 1
+    assert json.loads(compact.output) == json.loads(pretty.output)
+
+
+def test_main_accepts_args(capsys):
+    """Test that main() can be driven in-process with explicit arguments."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
+    assert exc_info.value.code == 0
+    assert "0.2.0" in capsys.readouterr().out
+
+
+def test_file_dash_reads_stdin(cli_runner, sample_gerrit_json):
+    """Test that --file - reads the review from stdin."""
+    result = cli_runner.invoke(cli, ["parse", "--file", "-", "--json"], input=sample_gerrit_json)
+    assert result.exit_code == 0
+    assert json.loads(result.output)["project"] == "test-project"
+
+
+def test_file_missing_is_usage_error(cli_runner, tmp_path):
+    """Test that a nonexistent --file is rejected before any parsing."""
+    result = cli_runner.invoke(cli, ["parse", "--file", str(tmp_path / "missing.json")])
+    assert result.exit_code == 2
+
+
+def test_file_invalid_utf8_exits_cleanly(cli_runner, tmp_path):
+    """Test that a non-UTF-8 --file is reported as an error, not a traceback."""
+    bad_file = tmp_path / "bad.json"
+    bad_file.write_bytes(b'{"subject": "\xff"}\n')
+
+    result = cli_runner.invoke(cli, ["parse", "--file", str(bad_file)])
+    assert result.exit_code == 1
+    assert not isinstance(result.exception, UnicodeDecodeError)
+
+
+def test_whitespace_only_input_exits_with_error(cli_runner):
+    """Test that input containing no JSON object is an error, not an empty success."""
+    result = cli_runner.invoke(cli, ["parse", "--json"], input="  \n\n")
+    assert result.exit_code == 1
+    assert result.output == ""
+
+
+def test_stats_only_input_is_not_an_error(cli_runner):
+    """Test that a query matching nothing (only the stats record) exits cleanly."""
+    result = cli_runner.invoke(cli, ["parse", "--json"], input='{"type": "stats", "rowCount": 0}\n')
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
+def test_trailing_junk_after_review_is_ignored(cli_runner, monkeypatch):
+    """Test that unparseable data after a complete object is tolerated, on both backends."""
+    import gerrit_review_parser.parser as parser_module
+
+    content = '{"number": 1}\ngarbage\n'
+    result = cli_runner.invoke(cli, ["parse", "--json"], input=content)
+    assert result.exit_code == 0
+    assert json.loads(result.output)["change_number"] == 1
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+    result = cli_runner.invoke(cli, ["parse", "--json"], input=content)
+    assert result.exit_code == 0
+    assert json.loads(result.output)["change_number"] == 1
+
+
+def test_changeid_prefix_normalized_consistently(cli_runner, monkeypatch, gerrit_env):
+    """Test that bare and 'change:'-prefixed IDs resolve to the same query on every path."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    dry_run = cli_runner.invoke(
+        cli, ["parse", "-c", "change:1", "-c", "2", "--dry-run"], env=gerrit_env
+    )
+    assert "change:change:" not in dry_run.output
+    assert "change:1" in dry_run.output and "change:2" in dry_run.output
+
+    batches = []
+    monkeypatch.setattr(
+        gerrit_module,
+        "fetch_many",
+        lambda query_strs, **kwargs: batches.append(list(query_strs)) or [b'{"number": 1}'] * 2,
+    )
+    result = cli_runner.invoke(cli, ["parse", "-c", "change:1", "-c", "2", "--json"])
+    assert result.exit_code == 0
+    assert batches == [["change:1", "change:2"]]
+
+
+def test_multiple_changes_json_output_format(cli_runner, monkeypatch, sample_gerrit_json):
+    """Test that several changes give NDJSON, or concatenated documents with --pretty."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    monkeypatch.setattr(
+        gerrit_module,
+        "fetch_many",
+        lambda query_strs, **kwargs: [sample_gerrit_json.encode()] * len(query_strs),
+    )
+
+    compact = cli_runner.invoke(cli, ["parse", "-c", "1", "-c", "2", "--json"])
+    assert [json.loads(line)["change_number"] for line in compact.output.splitlines()] == [
+        12345,
+        12345,
+    ]
+
+    pretty = cli_runner.invoke(cli, ["parse", "-c", "1", "-c", "2", "--json", "--pretty"])
+    decoder = json.JSONDecoder()
+    first, end = decoder.raw_decode(pretty.output)
+    second, _ = decoder.raw_decode(pretty.output[end:].lstrip())
+    assert first == second == json.loads(compact.output.splitlines()[0])
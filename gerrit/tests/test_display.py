@@ -0,0 +1,106 @@
+"""Unit tests for display module - rendered review output."""
+
+from gerrit_review_parser.display import display_review, show_code_context
+from gerrit_review_parser.models import Comment
+
+
+def test_display_review_output(capsys, sample_parsed_data, sample_comments):
+    """Test that display_review renders header and comments grouped by file."""
+    display_review(sample_parsed_data, sample_comments)
+
+    out = capsys.readouterr().out
+    assert "Review #12345" in out
+    assert "Comments: 3" in out
+    assert out.index("src/main.py") < out.index("src/utils.py")
+    assert "L  10 | Reviewer One [UNRESOLVED]" in out
+    assert "L  20 | Reviewer Two\n" in out
+
+
+def test_display_review_null_unresolved_flag(capsys):
+    """Test that a non-bool unresolved flag (e.g. JSON null) renders as resolved."""
+    data = {"number": 1, "subject": "s", "project": "p"}
+    comments = [Comment(file="a.py", line=1, reviewer="R", message="m", unresolved=None)]
+
+    display_review(data, comments)
+    assert "L   1 | R\n" in capsys.readouterr().out
+
+
+def test_display_review_no_comments(capsys, sample_parsed_data):
+    """Test that an empty comment list prints a notice instead of a header."""
+    display_review(sample_parsed_data, [])
+    assert capsys.readouterr().out == "No file comments found in review\n"
+
+
+def test_display_review_reads_each_file_once(capsys, monkeypatch, tmp_path):
+    """Test that several comments on one file share a single read of it."""
+    import gerrit_review_parser.display as display_module
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "code.py").write_text("".join(f"line {n}\n" for n in range(1, 21)))
+
+    reads = []
+    real_read = display_module.read_line_range
+    monkeypatch.setattr(
+        display_module,
+        "read_line_range",
+        lambda *args: reads.append(args) or real_read(*args),
+    )
+
+    comments = [
+        Comment("code.py", 3, "R", "first", True),
+        Comment("code.py", 15, "R", "second", True),
+    ]
+    display_review({}, comments)
+
+    out = capsys.readouterr().out
+    assert len(reads) == 1
+    assert "        3 >>> line 3" in out
+    assert "       15 >>> line 15" in out
+    assert "       17     line 17" in out
+    assert "       18" not in out
+
+
+def test_show_code_context_marks_line(capsys, monkeypatch, tmp_path):
+    """Test that code context surrounds and marks the commented line."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "code.py").write_text("".join(f"line {n}\n" for n in range(1, 11)))
+
+    show_code_context("code.py", 5)
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == ""
+    assert out[1:] == [
+        "        3     line 3",
+        "        4     line 4",
+        "        5 >>> line 5",
+        "        6     line 6",
+        "        7     line 7",
+    ]
+
+
+def test_show_code_context_clamped_at_file_edges(capsys, monkeypatch, tmp_path):
+    """Test that context is clamped at the first and last line of the file."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "code.py").write_text("".join(f"line {n}\n" for n in range(1, 11)))
+
+    show_code_context("code.py", 1)
+    show_code_context("code.py", 10)
+
+    out = capsys.readouterr().out.splitlines()
+    numbers = [int(line.split()[0]) for line in out if line]
+    assert numbers == [1, 2, 3, 8, 9, 10]
+
+
+def test_show_code_context_missing_file(capsys, monkeypatch, tmp_path):
+    """Test that a missing file produces no output."""
+    monkeypatch.chdir(tmp_path)
+    show_code_context("missing.py", 5)
+    assert capsys.readouterr().out == ""
+
+
+def test_show_code_context_directory(capsys, monkeypatch, tmp_path):
+    """Test that a comment path naming a directory produces no output."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pkg").mkdir()
+    show_code_context("pkg", 1)
+    assert capsys.readouterr().out == ""
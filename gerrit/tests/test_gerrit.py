@@ -1,17 +1,27 @@
 """Unit tests for gerrit module - config loading without os.environ mutation."""
 
 import os
+import stat
+import subprocess
+import tomllib
 
+import pytest
 import tomli_w
 
-from gerrit_review_parser.commands import build_query_command
-from gerrit_review_parser.config import load_gerrit_config, _load_config_file
+from gerrit_review_parser.commands import build_query_command, build_ssh_base
+from gerrit_review_parser.config import (
+    _load_config_file,
+    clear_config_cache,
+    load_gerrit_config,
+    save_config,
+)
+from gerrit_review_parser.gerrit import fetch_from_gerrit, fetch_many, fetch_to_file
 from gerrit_review_parser.models import GerritConfig
 
 
 def test_load_gerrit_config_from_env():
     """Test loading config from provided env dict without touching os.environ."""
-    original_environ = dict(os.environ)
+    original_environ = frozenset(os.environ.items())
     env = {
         "GERRIT_HOST": "test.gerrit.com",
         "GERRIT_USER": "testuser",
@@ -23,7 +33,15 @@ def test_load_gerrit_config_from_env():
     assert config.host == "test.gerrit.com"
     assert config.user == "testuser"
     assert config.port == "12345"
-    assert os.environ == original_environ
+    assert frozenset(os.environ.items()) == original_environ
+
+
+def test_load_gerrit_config_ssh_multiplex_opt_in():
+    """Test that connection multiplexing is only enabled via GERRIT_SSH_MULTIPLEX."""
+    env = {"GERRIT_HOST": "test.gerrit.com", "GERRIT_USER": "testuser"}
+
+    assert not load_gerrit_config(env=env).ssh_multiplex
+    assert load_gerrit_config(env={**env, "GERRIT_SSH_MULTIPLEX": "1"}).ssh_multiplex
 
 
 def test_load_gerrit_config_default_port():
@@ -51,6 +69,11 @@ def test_config_no_environ_mutation():
     assert set(os.environ.keys()) == original_keys
 
 
+def test_load_gerrit_config_reuses_instance(gerrit_env):
+    """Test that unchanged settings yield the same cached GerritConfig."""
+    assert load_gerrit_config(env=gerrit_env) is load_gerrit_config(env=dict(gerrit_env))
+
+
 def test_build_query_command_structure():
     """Test that build_query_command produces correct command structure."""
     config = GerritConfig(host="gerrit.example.com", port="29418", user="testuser")
@@ -66,14 +89,54 @@ def test_build_query_command_structure():
     assert "change:12345" in cmd
 
 
+def test_build_ssh_base_no_multiplexing_by_default():
+    """Test that ssh_config's own Control* settings are not overridden by default."""
+    config = GerritConfig(host="gerrit.example.com", port="29418", user="testuser")
+    cmd = build_ssh_base(config)
+
+    assert not any(arg.startswith("Control") for arg in cmd)
+
+
+def test_build_ssh_base_reuses_connection():
+    """Test that ssh is told to multiplex over a persistent master connection."""
+    config = GerritConfig(
+        host="gerrit.example.com", port="29418", user="testuser", ssh_multiplex=True
+    )
+    cmd = build_ssh_base(config)
+
+    assert "ControlMaster=auto" in cmd
+    assert "ControlPersist=60s" in cmd
+    assert "ControlPath=~/.ssh/cm-%C" in cmd
+    # Options must precede the destination
+    assert cmd.index("ControlMaster=auto") < cmd.index("testuser@gerrit.example.com")
+
+
+def test_build_ssh_base_cached_per_config():
+    """Test that equal configs share one cached base argv that callers cannot mutate."""
+    config = GerritConfig(host="gerrit.example.com", port="29418", user="testuser")
+    same = GerritConfig(host="gerrit.example.com", port="29418", user="testuser")
+    assert build_ssh_base(config) is build_ssh_base(same)
+
+    build_query_command(config, "change:12345").append("extra")
+    assert "extra" not in build_ssh_base(config)
+
+
 def test_build_query_command_includes_flags():
     """Test that build_query_command includes all required query flags."""
     config = GerritConfig(host="gerrit.example.com", port="29418", user="testuser")
     cmd = build_query_command(config, "change:12345")
 
     assert "--patch-sets" in cmd
-    assert "--files" in cmd
     assert "--comments" in cmd
+    assert "--files" not in cmd
+
+
+def test_build_query_command_include_files():
+    """Test that file lists are only requested when asked for."""
+    config = GerritConfig(host="gerrit.example.com", port="29418", user="testuser")
+    cmd = build_query_command(config, "change:12345", include_files=True)
+
+    assert "--files" in cmd
 
 
 def test_load_config_file_toml(monkeypatch, tmp_path):
@@ -91,7 +154,7 @@ def test_load_config_file_toml(monkeypatch, tmp_path):
         tomli_w.dump(data, f)
 
     import gerrit_review_parser.config as config_module
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
 
     result = _load_config_file()
 
@@ -106,7 +169,7 @@ def test_load_config_file_missing_returns_none(monkeypatch, tmp_path):
     config_file = tmp_path / "nonexistent" / "config.toml"
 
     import gerrit_review_parser.config as config_module
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
 
     result = _load_config_file()
     assert result is None
@@ -122,12 +185,24 @@ def test_load_config_file_invalid_toml_returns_none(monkeypatch, tmp_path):
         f.write("this is not valid toml [[[")
 
     import gerrit_review_parser.config as config_module
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
 
     result = _load_config_file()
     assert result is None
 
 
+def test_load_config_file_invalid_utf8_returns_none(monkeypatch, tmp_path):
+    """Test that a config file that is not UTF-8 is treated as invalid."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(b'host = "caf\xe9"\n')
+
+    import gerrit_review_parser.config as config_module
+
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
+
+    assert _load_config_file() is None
+
+
 def test_load_config_file_missing_keys_returns_none(monkeypatch, tmp_path):
     """Test that TOML file with missing required keys returns None."""
     config_dir = tmp_path / ".config" / "gerrit-review-parser"
@@ -139,12 +214,26 @@ def test_load_config_file_missing_keys_returns_none(monkeypatch, tmp_path):
         tomli_w.dump(data, f)
 
     import gerrit_review_parser.config as config_module
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
 
     result = _load_config_file()
     assert result is None
 
 
+def test_save_config_round_trip(monkeypatch, tmp_path):
+    """Test that a saved config is read back unchanged."""
+    config_file = tmp_path / "nested" / "config.toml"
+
+    import gerrit_review_parser.config as config_module
+
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
+
+    config = GerritConfig(host="saved.gerrit.com", port="2222", user="saver")
+    save_config(config)
+
+    assert _load_config_file() == config
+
+
 def test_env_takes_precedence_over_file(monkeypatch, tmp_path):
     """Test that environment variables take precedence over config file."""
     config_dir = tmp_path / ".config" / "gerrit-review-parser"
@@ -160,7 +249,7 @@ def test_env_takes_precedence_over_file(monkeypatch, tmp_path):
         tomli_w.dump(data, f)
 
     import gerrit_review_parser.config as config_module
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
 
     env = {
         "GERRIT_HOST": "env.gerrit.com",
@@ -172,3 +261,167 @@ def test_env_takes_precedence_over_file(monkeypatch, tmp_path):
     assert config.host == "env.gerrit.com"
     assert config.user == "envuser"
     assert config.port == "29418"  # DEFAULT_PORT, not file port
+
+
+def test_load_config_file_cached_until_modified(monkeypatch, tmp_path):
+    """Test that the config file is parsed once and re-read after it changes."""
+    config_file = tmp_path / "config.toml"
+    with open(config_file, "wb") as f:
+        tomli_w.dump({"host": "old.gerrit.com", "port": "29418", "user": "u"}, f)
+
+    import gerrit_review_parser.config as config_module
+
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
+
+    calls = []
+    real_loads = tomllib.loads
+    monkeypatch.setattr(tomllib, "loads", lambda s: calls.append(1) or real_loads(s))
+
+    assert _load_config_file().host == "old.gerrit.com"
+    assert _load_config_file().host == "old.gerrit.com"
+    assert len(calls) == 1
+
+    with open(config_file, "wb") as f:
+        tomli_w.dump({"host": "new.gerrit.com", "port": "29418", "user": "u"}, f)
+    os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1))
+
+    assert _load_config_file().host == "new.gerrit.com"
+    assert len(calls) == 2
+
+
+def test_fetch_many_preserves_order(monkeypatch, gerrit_config):
+    """Test that fetch_many returns responses in the order of the queries."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    monkeypatch.setattr(
+        gerrit_module,
+        "fetch_from_gerrit",
+        lambda query_str, config, **kwargs: f"result:{query_str}",
+    )
+
+    queries = [f"change:{n}" for n in range(20)]
+    assert fetch_many(queries, gerrit_config) == [f"result:{q}" for q in queries]
+
+
+def test_fetch_from_gerrit_returns_bytes(monkeypatch, gerrit_config):
+    """Test that the ssh output is returned undecoded."""
+
+    def fake_run(cmd, **kwargs):
+        assert "text" not in kwargs
+        return subprocess.CompletedProcess(cmd, 0, stdout=b'{"number": 1}\n', stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    assert fetch_from_gerrit("change:1", gerrit_config) == b'{"number": 1}\n'
+
+
+def test_fetch_from_gerrit_failure_exits(monkeypatch, caplog, gerrit_config):
+    """Test that a failing ssh command exits with the decoded stderr logged."""
+
+    def fake_run(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, output=b"", stderr=b"fatal: \xff denied")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    with pytest.raises(SystemExit):
+        fetch_from_gerrit("change:1", gerrit_config)
+    assert "Gerrit query failed: fatal: \ufffd denied" in caplog.text
+
+
+def test_fetch_to_file_streams_to_disk(monkeypatch, tmp_path, gerrit_config):
+    """Test that ssh stdout is handed the output file rather than captured."""
+
+    def fake_run(cmd, **kwargs):
+        assert "capture_output" not in kwargs
+        kwargs["stdout"].write(b'{"number": 1}\n')
+        return subprocess.CompletedProcess(cmd, 0, stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    out_file = tmp_path / "review-1.json"
+    fetch_to_file("change:1", out_file, gerrit_config)
+    assert out_file.read_bytes() == b'{"number": 1}\n'
+
+
+def test_fetch_to_file_uses_umask_mode(monkeypatch, tmp_path, gerrit_config):
+    """Test that the saved file gets the usual umask-derived mode, not the temp file's 0600."""
+    import gerrit_review_parser.gerrit as gerrit_module
+
+    def fake_run(cmd, **kwargs):
+        kwargs["stdout"].write(b'{"number": 1}\n')
+        return subprocess.CompletedProcess(cmd, 0, stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(gerrit_module, "_umask", lambda: 0o022)
+    out_file = tmp_path / "review-1.json"
+    fetch_to_file("change:1", out_file, gerrit_config)
+    assert stat.S_IMODE(out_file.stat().st_mode) == 0o644
+
+    out_file.chmod(0o640)
+    fetch_to_file("change:1", out_file, gerrit_config)
+    assert stat.S_IMODE(out_file.stat().st_mode) == 0o640
+
+
+def test_fetch_to_file_failure_removes_file(monkeypatch, tmp_path, gerrit_config):
+    """Test that a failed query does not leave a partial file behind."""
+
+    def fake_run(cmd, **kwargs):
+        kwargs["stdout"].write(b'{"partial"')
+        raise subprocess.CalledProcessError(1, cmd, stderr=b"denied")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    out_file = tmp_path / "review-1.json"
+    with pytest.raises(SystemExit):
+        fetch_to_file("change:1", out_file, gerrit_config)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_to_file_failure_keeps_existing_file(monkeypatch, tmp_path, gerrit_config):
+    """Test that a failed query leaves a previously saved file untouched."""
+
+    def fake_run(cmd, **kwargs):
+        kwargs["stdout"].write(b'{"partial"')
+        raise subprocess.CalledProcessError(1, cmd, stderr=b"denied")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    out_file = tmp_path / "review-1.json"
+    out_file.write_bytes(b'{"number": 1}\n')
+    with pytest.raises(SystemExit):
+        fetch_to_file("change:1", out_file, gerrit_config)
+    assert out_file.read_bytes() == b'{"number": 1}\n'
+    assert list(tmp_path.iterdir()) == [out_file]
+
+
+def test_load_config_file_reparsed_when_size_changes(monkeypatch, tmp_path):
+    """Test that a rewrite keeping the same mtime is still picked up."""
+    config_file = tmp_path / "config.toml"
+    with open(config_file, "wb") as f:
+        tomli_w.dump({"host": "old.gerrit.com", "port": "29418", "user": "u"}, f)
+    mtime_ns = config_file.stat().st_mtime_ns
+
+    import gerrit_review_parser.config as config_module
+
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
+
+    assert _load_config_file().host == "old.gerrit.com"
+
+    with open(config_file, "wb") as f:
+        tomli_w.dump({"host": "longer-new.gerrit.com", "port": "29418", "user": "u"}, f)
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+
+    assert _load_config_file().host == "longer-new.gerrit.com"
+
+
+def test_clear_config_cache_forces_reparse(monkeypatch, tmp_path):
+    """Test that clear_config_cache() drops the cached parse of an unchanged file."""
+    config_file = tmp_path / "config.toml"
+    with open(config_file, "wb") as f:
+        tomli_w.dump({"host": "gerrit.com", "port": "29418", "user": "u"}, f)
+
+    import gerrit_review_parser.config as config_module
+
+    monkeypatch.setattr(config_module, "_config_file", lambda: config_file)
+
+    first = _load_config_file()
+    assert _load_config_file() is first
+
+    clear_config_cache()
+    assert _load_config_file() is not first
+    assert _load_config_file() == first
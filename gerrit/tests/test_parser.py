@@ -2,9 +2,14 @@
 
 import json
 
+import pytest
+
 from gerrit_review_parser.models import ReviewOutput
 from gerrit_review_parser.parser import (
+    dump_json,
     extract_comments,
+    iter_comments,
+    iter_json_objects,
     parse_json_content,
 )
 
@@ -25,6 +30,36 @@ def test_parse_json_content_multi_object():
     assert "type" not in result
 
 
+def test_parse_json_content_pretty_printed_multi_object():
+    """Test a pretty-printed first object followed by a stats object."""
+    json_str = '{\n  "project": "test",\n  "number": 123\n}\n{"type": "stats"}'
+    result = parse_json_content(json_str.encode())
+    assert result == {"project": "test", "number": 123}
+
+
+def test_iter_json_objects_yields_every_object():
+    """Test that all concatenated Gerrit objects are returned, not just the first."""
+    json_str = '{"number": 1}\n{"number": 2}\n{"type": "stats", "rowCount": 2}\n'
+    assert list(iter_json_objects(json_str)) == [
+        {"number": 1},
+        {"number": 2},
+        {"type": "stats", "rowCount": 2},
+    ]
+
+
+def test_iter_json_objects_pretty_printed():
+    """Test that multi-line objects are split correctly."""
+    json_str = '{\n  "number": 1\n}\n{\n  "type": "stats"\n}'
+    assert list(iter_json_objects(json_str.encode())) == [{"number": 1}, {"type": "stats"}]
+
+
+def test_iter_json_objects_is_lazy():
+    """Test that objects after the ones consumed are never parsed."""
+    objects = iter_json_objects(b'{"number": 1}\nnot json\n')
+    assert next(objects) == {"number": 1}
+    assert parse_json_content(b'{"number": 1}\nnot json\n') == {"number": 1}
+
+
 def test_extract_comments_deterministic(sample_parsed_data):
     """Test that extract_comments is deterministic - same input produces same output."""
     result1 = extract_comments(sample_parsed_data)
@@ -51,10 +86,26 @@ def test_extract_comments_unresolved_only(sample_parsed_data):
     assert all(c.unresolved for c in comments)
 
 
-def test_review_output_structure(sample_parsed_data):
+def test_iter_comments_is_lazy_and_unsorted():
+    """iter_comments() yields comments in document order without sorting."""
+    data = {
+        "patchSets": [
+            {
+                "comments": [
+                    {"file": "b.py", "line": 1, "reviewer": {"name": "R"}, "message": "m"},
+                    {"file": "a.py", "line": 2, "reviewer": {"name": "R"}, "message": "m"},
+                ]
+            }
+        ]
+    }
+    comments = iter_comments(data)
+    assert next(comments).file == "b.py"
+    assert next(comments).file == "a.py"
+
+
+def test_review_output_structure(sample_parsed_data, sample_comments):
     """Test that ReviewOutput.to_dict() returns expected structure."""
-    comments = extract_comments(sample_parsed_data)
-    result = ReviewOutput.from_gerrit_data(sample_parsed_data, comments).to_dict()
+    result = ReviewOutput.from_gerrit_data(sample_parsed_data, sample_comments).to_dict()
 
     assert "project" in result
     assert "change_number" in result
@@ -63,20 +114,18 @@ def test_review_output_structure(sample_parsed_data):
     assert isinstance(result["comments"], list)
 
 
-def test_review_output_is_json_serializable(sample_parsed_data):
+def test_review_output_is_json_serializable(sample_parsed_data, sample_comments):
     """Test that ReviewOutput.to_dict() produces JSON-serializable output."""
-    comments = extract_comments(sample_parsed_data)
-    result = ReviewOutput.from_gerrit_data(sample_parsed_data, comments).to_dict()
+    result = ReviewOutput.from_gerrit_data(sample_parsed_data, sample_comments).to_dict()
     json_str = json.dumps(result)
     assert json_str is not None
     parsed = json.loads(json_str)
     assert parsed == result
 
 
-def test_review_output_comment_structure(sample_parsed_data):
+def test_review_output_comment_structure(sample_parsed_data, sample_comments):
     """Test that comments in ReviewOutput.to_dict() have all required fields."""
-    comments = extract_comments(sample_parsed_data)
-    result = ReviewOutput.from_gerrit_data(sample_parsed_data, comments).to_dict()
+    result = ReviewOutput.from_gerrit_data(sample_parsed_data, sample_comments).to_dict()
 
     for comment in result["comments"]:
         assert "file" in comment
@@ -86,6 +135,31 @@ def test_review_output_comment_structure(sample_parsed_data):
         assert "unresolved" in comment
 
 
+def test_comment_to_dict_matches_fields(sample_comments):
+    """Test that the hand-written Comment.to_dict() covers every dataclass field."""
+    from dataclasses import asdict
+
+    for comment in sample_comments:
+        assert comment.to_dict() == asdict(comment)
+
+
+def test_comment_has_no_instance_dict(sample_comments):
+    """Test that Comment is slotted, so instances carry no per-object __dict__."""
+    comment = sample_comments[0]
+    assert not hasattr(comment, "__dict__")
+
+
+def test_extract_comments_interns_repeated_strings():
+    """Repeated file paths and reviewer names share one string object."""
+    comments = [
+        {"file": "src/a.py", "line": n, "reviewer": {"name": "Rev"}, "message": "m"} for n in (1, 2)
+    ]
+    data = json.loads(json.dumps({"patchSets": [{"comments": comments}]}))
+    first, second = extract_comments(data)
+    assert first.file is second.file
+    assert first.reviewer is second.reviewer
+
+
 # --- Edge case tests (bug catchers) ---
 
 
@@ -147,3 +221,102 @@ def test_comment_reviewer_missing_name_skipped():
     }
     comments = extract_comments(data)
     assert comments == []
+
+
+# --- JSON backend tests ---
+
+
+def test_parse_json_content_stdlib_fallback(monkeypatch):
+    """Parsing works without orjson installed."""
+    import gerrit_review_parser.parser as parser_module
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+
+    json_str = '{"project": "test", "number": 123}\n{"type": "stats", "rowCount": 1}'
+    result = parse_json_content(json_str)
+    assert result == {"project": "test", "number": 123}
+
+
+def test_parse_json_content_leading_whitespace_stdlib_fallback(monkeypatch):
+    """Leading blank lines do not break the stdlib raw_decode() path."""
+    import gerrit_review_parser.parser as parser_module
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+
+    result = parse_json_content('\n  {"project": "test"}\n{"type": "stats"}')
+    assert result == {"project": "test"}
+
+
+def test_iter_json_objects_stdlib_fallback(monkeypatch):
+    """iter_json_objects() works without orjson installed."""
+    import gerrit_review_parser.parser as parser_module
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+
+    json_bytes = b'\n{"number": 1}\n{"type": "stats"}\n'
+    assert list(iter_json_objects(json_bytes)) == [{"number": 1}, {"type": "stats"}]
+
+
+def test_dump_json_round_trip(sample_parsed_data):
+    """dump_json() returns bytes that decode back to the same data."""
+    payload = dump_json(sample_parsed_data)
+    assert isinstance(payload, bytes)
+    assert json.loads(payload) == sample_parsed_data
+
+
+def test_dump_json_stdlib_fallback(monkeypatch, sample_parsed_data):
+    """dump_json() works without orjson installed."""
+    import gerrit_review_parser.parser as parser_module
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+
+    assert json.loads(dump_json(sample_parsed_data)) == sample_parsed_data
+    assert json.loads(dump_json(sample_parsed_data, pretty=True)) == sample_parsed_data
+
+
+def test_dump_json_review_output_matches_to_dict(monkeypatch, sample_parsed_data, sample_comments):
+    """A ReviewOutput serializes the same as its to_dict() on both backends."""
+    import gerrit_review_parser.parser as parser_module
+
+    output = ReviewOutput.from_gerrit_data(sample_parsed_data, sample_comments)
+    expected = output.to_dict()
+
+    assert json.loads(dump_json(output)) == expected
+    monkeypatch.setattr(parser_module, "orjson", None)
+    assert json.loads(dump_json(output)) == expected
+
+
+def test_parse_json_content_bytes_stdlib_fallback(monkeypatch):
+    """Bytes input is decoded for the stdlib parser."""
+    import gerrit_review_parser.parser as parser_module
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+
+    result = parse_json_content(b'{"subject": "caf\xc3\xa9"}\n{"type": "stats"}')
+    assert result == {"subject": "café"}
+
+
+def test_parse_json_content_invalid_utf8_exits(monkeypatch, caplog):
+    """Non-UTF-8 bytes exit through fatal_exit on both backends."""
+    import gerrit_review_parser.parser as parser_module
+
+    with pytest.raises(SystemExit):
+        parse_json_content(b'{"subject": "\xff"}\n{"type": "stats"}')
+    monkeypatch.setattr(parser_module, "orjson", None)
+    with pytest.raises(SystemExit):
+        parse_json_content(b'{"subject": "\xff"}\n{"type": "stats"}')
+    assert "Invalid UTF-8" in caplog.text
+
+
+def test_dump_json_non_ascii_matches_across_backends(monkeypatch):
+    """Non-ASCII text is emitted as UTF-8 by both backends, byte for byte."""
+    import gerrit_review_parser.parser as parser_module
+
+    data = {"message": "Zażółć gęślą jaźń ✓"}
+    compact = dump_json(data)
+    pretty = dump_json(data, pretty=True)
+    assert "ż".encode() in compact
+
+    monkeypatch.setattr(parser_module, "orjson", None)
+    assert dump_json(data) == compact
+    assert dump_json(data, pretty=True) == pretty